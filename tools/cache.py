@@ -0,0 +1,7 @@
+import os
+
+
+FASTF1_CACHE_DIR: str = os.path.expanduser("~/.cache/fastf1")
+F1VIZ_CACHE_DIR: str = os.path.expanduser("~/.cache/f1viz")
+RESULTS_CACHE_DIR: str = os.path.join(F1VIZ_CACHE_DIR, "results")
+TELEMETRY_CACHE_DIR: str = os.path.join(F1VIZ_CACHE_DIR, "telemetry")
@@ -1,8 +1,158 @@
+import datetime
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import List, Dict, Any, Optional
+import diskcache
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import fastf1
+from tools.cache import FASTF1_CACHE_DIR, RESULTS_CACHE_DIR
+
+
+CURRENT_SEASON_EXPIRE: int = 24 * 60 * 60  # seconds
+MAX_WORKERS: int = 8
+
+os.makedirs(FASTF1_CACHE_DIR, exist_ok=True)
+fastf1.Cache.enable_cache(FASTF1_CACHE_DIR)
+
+_results_cache: diskcache.Cache = diskcache.Cache(RESULTS_CACHE_DIR)
+
+# FastF1's rate limiters and on-disk API cache are process-wide and not thread-safe
+_fastf1_lock: threading.Lock = threading.Lock()
+
+
+def _get_session(event: fastf1.events.Event, session_code: str) -> Optional[fastf1.core.Session]:
+    """
+    Creates a session of an event from the already loaded schedule.
+
+    Called on the main thread, so workers never have to look up the event
+    schedule through fastf1 themselves.
+
+    Args:
+        event: The event, as returned by the event schedule.
+        session_code: The fastf1 session identifier (e.g. "R", "S").
+
+    Returns:
+        The (unloaded) session, or None if the event has no such session.
+    """
+    try:
+        return event.get_session(session_code)
+    except Exception:
+        return None
+
+
+def _load_session_results(
+    year: int, round_number: int, session_code: str, session: Optional[fastf1.core.Session]
+) -> Optional[pd.DataFrame]:
+    """
+    Loads the classification of a single session, backed by an on-disk cache.
+
+    Only the columns used by the heatmap are stored, so cache hits skip both
+    the network and the deserialization of the full fastf1 Session object.
+    Sessions without results (e.g. races that haven't happened yet) are not
+    cached, so they are fetched again on the next call. Results from the
+    current season expire after CURRENT_SEASON_EXPIRE seconds so post-race
+    penalties and disqualifications are picked up.
+
+    Args:
+        year: The Formula 1 season year.
+        round_number: The round number of the event within the season.
+        session_code: The fastf1 session identifier (e.g. "R", "S").
+        session: The session to load on a cache miss, or None if unavailable.
+
+    Returns:
+        A DataFrame with the Abbreviation, Points and Position columns, or
+        None if the session could not be loaded or has no results.
+    """
+    key: tuple = (year, round_number, session_code)
+    results: Optional[pd.DataFrame] = _results_cache.get(key)
+    if results is not None:
+        return results
+
+    if session is None:
+        return None
+
+    try:
+        with _fastf1_lock:
+            session.load(laps=False, telemetry=False, weather=False, messages=False)
+
+            if session.results is None or session.results.empty:
+                return None
+    except Exception:
+        return None
+
+    results = pd.DataFrame(session.results[["Abbreviation", "Points", "Position"]])
+    expire: Optional[int] = (
+        CURRENT_SEASON_EXPIRE if year >= datetime.date.today().year else None
+    )
+    _results_cache.set(key, results, expire=expire)
+    return results
+
+
+@lru_cache(maxsize=16)
+def _get_schedule(year: int) -> pd.DataFrame:
+    """
+    Returns the event schedule for a season, excluding testing.
+
+    Memoized per process, so the schedule is only requested once per year.
+    Callers must not mutate the returned DataFrame.
+
+    Args:
+        year: The Formula 1 season year.
+
+    Returns:
+        The fastf1 event schedule.
+    """
+    return fastf1.get_event_schedule(year, include_testing=False)
+
+
+def _fetch_event(year: int, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Loads the race (and sprint, if any) results for a single event.
+
+    Runs on a worker thread, so it only loads the sessions created by the
+    caller and leaves the standings accumulation to the caller.
+
+    Args:
+        year: The Formula 1 season year.
+        job: A dict with the event name, round number, and the race and
+            sprint sessions (either may be None).
+
+    Returns:
+        A dict with the event name, round number, race results and sprint
+        points per driver, or None if the race has no results yet.
+    """
+    event_name: str = job["event_name"]
+    round_number: int = job["round_number"]
+
+    race_results: Optional[pd.DataFrame] = _load_session_results(
+        year, round_number, "R", job["race_session"]
+    )
+    if race_results is None:
+        return None
+
+    sprint_points_dict: Dict[str, float] = {}
+
+    if job["is_sprint"]:
+        sprint_results: Optional[pd.DataFrame] = _load_session_results(
+            year, round_number, "S", job["sprint_session"]
+        )
+
+        if sprint_results is not None:
+            sprint_points_dict = dict(
+                zip(sprint_results["Abbreviation"].to_numpy(), sprint_results["Points"].to_numpy())
+            )
+
+    return {
+        "event_name": event_name,
+        "round_number": round_number,
+        "race_results_df": race_results,
+        "sprint_points_dict": sprint_points_dict,
+    }
 
 
 def create_season_heatmap(year: int) -> go.Figure:
@@ -26,6 +176,8 @@ def create_season_heatmap(year: int) -> go.Figure:
     Notes:
         - Races that haven't occurred yet are automatically skipped
         - Sprint race points are combined with main race points
+        - Session results are cached on disk, so repeat calls skip the download
+        - Events are fetched on a thread pool; FastF1 loads are serialized
         - Drivers are sorted by total points (ascending order)
     
     Example:
@@ -33,85 +185,76 @@ def create_season_heatmap(year: int) -> go.Figure:
         >>> fig.show()
     """
     
-    schedule: pd.DataFrame = fastf1.get_event_schedule(year, include_testing=False)
-    standings: List[Dict[str, Any]] = []
-    short_event_names: List[str] = []
-
-    for _, event in schedule.iterrows():
-        event_name: str = event["EventName"]
-        round_number: int = event["RoundNumber"]
-        
-        try:
-            race: fastf1.core.Session = fastf1.get_session(year, event_name, "R")
-            race.load(laps=False, telemetry=False, weather=False, messages=False)
-            
-            if race.results is None or race.results.empty:
-                continue
-                
-        except Exception as e:
+    schedule: pd.DataFrame = _get_schedule(year)
+    frames: List[pd.DataFrame] = []
+    jobs: List[Dict[str, Any]] = []
+
+    # Sessions are created here from the loaded schedule; workers only load them
+    for round_number in schedule["RoundNumber"].to_numpy():
+        event: fastf1.events.Event = schedule.get_event_by_round(int(round_number))
+        is_sprint: bool = event["EventFormat"] == "sprint_qualifying"
+        jobs.append(
+            {
+                "event_name": event["EventName"],
+                "round_number": int(round_number),
+                "is_sprint": is_sprint,
+                "race_session": _get_session(event, "R"),
+                "sprint_session": _get_session(event, "S") if is_sprint else None,
+            }
+        )
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        fetched: List[Optional[Dict[str, Any]]] = list(
+            executor.map(partial(_fetch_event, year), jobs)
+        )
+
+    for event_data in fetched:
+        if event_data is None:
             continue  # Skipping races that haven't happened yet
-        
-        short_event_names.append(event_name.replace("Grand Prix", "").strip())
-
-        sprint: Optional[fastf1.core.Session] = None
-        sprint_points_dict: Dict[str, float] = {}
-        
-        if event["EventFormat"] == "sprint_qualifying":
-            try:
-                sprint = fastf1.get_session(year, event_name, "S")
-                sprint.load(laps=False, telemetry=False, weather=False, messages=False)
-                
-                if sprint.results is not None and not sprint.results.empty:
-                    for _, sprint_row in sprint.results.iterrows():
-                        abbreviation: str = sprint_row["Abbreviation"]
-                        sprint_points: float = sprint_row["Points"]
-                        sprint_points_dict[abbreviation] = sprint_points
-            except Exception:
-                pass
-
-        for _, driver_row in race.results.iterrows():
-            abbreviation: str = driver_row["Abbreviation"]
-            race_points: float = driver_row["Points"]
-            race_position: int = driver_row["Position"]
-
-            sprint_points: float = sprint_points_dict.get(abbreviation, 0)
-
-            standings.append(
-                {
-                    "EventName": event_name,
-                    "RoundNumber": round_number,
-                    "Driver": abbreviation,
-                    "Points": race_points + sprint_points,
-                    "Position": race_position,
-                }
-            )
 
-    if not standings:
+        sub: pd.DataFrame = event_data["race_results_df"][["Abbreviation", "Points", "Position"]].copy()
+        sub["Points"] += sub["Abbreviation"].map(event_data["sprint_points_dict"]).fillna(0)
+        sub["EventName"] = event_data["event_name"]
+        sub["RoundNumber"] = event_data["round_number"]
+        frames.append(sub.rename(columns={"Abbreviation": "Driver"}))
+
+    if not frames:
         raise ValueError(f"No race data available for {year} season yet")
 
-    df: pd.DataFrame = pd.DataFrame(standings)
-    heatmap_data: pd.DataFrame = df.pivot(
-        index="Driver", columns="RoundNumber", values="Points"
-    ).fillna(0)
+    df: pd.DataFrame = pd.concat(frames, ignore_index=True)
+    event_names: Dict[int, str] = dict(zip(df["RoundNumber"].to_numpy(), df["EventName"].to_numpy()))
 
-    heatmap_data["total_points"] = heatmap_data.sum(axis=1)
-    heatmap_data: pd.DataFrame = heatmap_data.sort_values(by="total_points", ascending=True)
-    total_points: pd.Series = heatmap_data["total_points"]
-    heatmap_data = heatmap_data.drop(columns=["total_points"])
-    
-    position_data: pd.DataFrame = df.pivot(
-        index="Driver", columns="RoundNumber", values="Position"
-    ).fillna("N/A")
+    df = df.astype(
+        {
+            "Driver": "category",
+            "RoundNumber": "category",
+            "Points": "float32",
+            "Position": "float32",
+        }
+    )
 
-    hover_info: List[List[Dict[str, Any]]] = [
-        [
-            {
-                "position": position_data.at[driver, race],
-            }
-            for race in heatmap_data.columns
-        ]
-        for driver in heatmap_data.index
+    grouped: pd.DataFrame = df.groupby(["Driver", "RoundNumber"], observed=True, sort=False).agg(
+        Points=("Points", "sum"), Position=("Position", "first")
+    )
+    wide: pd.DataFrame = grouped.unstack("RoundNumber")
+    heatmap_data: pd.DataFrame = wide["Points"].fillna(0).sort_index(axis=1)
+    short_event_names: List[str] = [
+        event_names[round_number].replace("Grand Prix", "").strip()
+        for round_number in heatmap_data.columns
     ]
+
+    totals: np.ndarray = heatmap_data.to_numpy().sum(axis=1)
+    order: np.ndarray = np.argsort(totals, kind="stable")
+    heatmap_data = heatmap_data.iloc[order]
+    total_points: np.ndarray = totals[order]
+    
+    position_arr: np.ndarray = (
+        wide["Position"]
+        .astype(object)
+        .fillna("N/A")
+        .reindex(index=heatmap_data.index, columns=heatmap_data.columns)
+        .to_numpy()
+    )
     
     fig: go.Figure = make_subplots(
         rows=1,
@@ -121,8 +264,8 @@ def create_season_heatmap(year: int) -> go.Figure:
     )
     fig.update_layout(width=900, height=800)
 
-    max_points: float = heatmap_data.values.max() if heatmap_data.values.max() > 0 else 1
-    max_total_points: float = total_points.max() if total_points.max() > 0 else 1
+    max_points: float = heatmap_data.values.max() or 1
+    max_total_points: float = total_points.max() or 1
 
     fig.add_trace(
         go.Heatmap(
@@ -132,12 +275,12 @@ def create_season_heatmap(year: int) -> go.Figure:
             text=heatmap_data.values,
             texttemplate="%{text}",
             textfont={"size": 12},
-            customdata=hover_info,
+            customdata=position_arr,
             hovertemplate=(
                 "Driver: %{y}<br>"
                 "Race Name: %{x}<br>"
                 "Points: %{z}<br>"
-                "Position: %{customdata.position}<extra></extra>"
+                "Position: %{customdata}<extra></extra>"
             ),
             colorscale="YlGnBu",
             showscale=False,
@@ -152,8 +295,8 @@ def create_season_heatmap(year: int) -> go.Figure:
         go.Heatmap(
             x=["Total Points"] * len(total_points),
             y=heatmap_data.index,
-            z=total_points.values,
-            text=total_points.values,
+            z=total_points,
+            text=total_points,
             texttemplate="%{text}",
             textfont={"size": 12},
             colorscale="YlGnBu",
@@ -1,4 +1,5 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import diskcache
 import matplotlib as mpl
 import numpy as np
 from matplotlib import pyplot as plt
@@ -7,6 +8,7 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 import plotly.graph_objects as go
 import fastf1
+from tools.cache import TELEMETRY_CACHE_DIR
 
 
 gp_arr: List[str] = [
@@ -46,6 +48,75 @@ session_dict: Dict[str, str] = {
     "R": "Grand Prix"
 }
 
+_GP_NAME_BY_ROUND: Dict[int, str] = {i + 1: n for i, n in enumerate(gp_arr)}
+
+PLOTLY_MAX_POINTS: int = 500
+
+_telemetry_cache: diskcache.Cache = diskcache.Cache(TELEMETRY_CACHE_DIR)
+
+
+@_telemetry_cache.memoize(typed=True)
+def _load_fastest_lap_xyz(year: int, gp: str | int, ses: str, driver: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Loads the X, Y and Speed telemetry of a driver's fastest lap.
+
+    Results are memoized on disk by (year, gp, ses, driver), so repeat calls
+    skip loading the full session and only read back the three arrays.
+
+    Args:
+        year: The Formula 1 season year.
+        gp: Grand Prix event name or round number.
+        ses: Session code from session_dict keys.
+        driver: Three-letter driver code.
+
+    Returns:
+        A tuple of float32 arrays (x, y, speed).
+    """
+    session: fastf1.core.Session = fastf1.get_session(year, gp, ses)
+    session.load()
+    lap: fastf1.core.Lap = session.laps.pick_drivers(driver).pick_fastest()
+
+    x: np.ndarray = lap.telemetry['X'].to_numpy(dtype=np.float32, copy=False)
+    y: np.ndarray = lap.telemetry['Y'].to_numpy(dtype=np.float32, copy=False)
+    speed: np.ndarray = lap.telemetry['Speed'].to_numpy(dtype=np.float32, copy=False)
+
+    return x, y, speed
+
+
+def _resolve_name_and_session_label(gp: str | int, ses: str) -> Tuple[str, str]:
+    """
+    Resolves the Grand Prix name and session label used in plot titles.
+
+    Args:
+        gp: Grand Prix event name or round number (1-indexed).
+        ses: Session code from session_dict keys.
+
+    Returns:
+        A tuple of (Grand Prix name, session label).
+    """
+    name: str = gp if isinstance(gp, str) else _GP_NAME_BY_ROUND[gp]
+    return name, session_dict[ses]
+
+
+def _subsample_by_arclength(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """
+    Picks indices of up to n samples spaced evenly by distance along the track.
+
+    Args:
+        x: X coordinates of the lap.
+        y: Y coordinates of the lap.
+        n: Maximum number of samples to keep.
+
+    Returns:
+        Sorted, unique indices into x and y.
+    """
+    if len(x) <= n:
+        return np.arange(len(x))
+
+    arc: np.ndarray = np.concatenate(([0], np.cumsum(np.hypot(np.diff(x), np.diff(y)))))
+    idx: np.ndarray = np.searchsorted(arc, np.linspace(0, arc[-1], n))
+    return np.unique(np.minimum(idx, len(x) - 1))
+
 
 def plot_fastest_lap(year: int, gp: str | int, ses: str, driver: str) -> None:
     """
@@ -75,31 +146,28 @@ def plot_fastest_lap(year: int, gp: str | int, ses: str, driver: str) -> None:
         - The plot shows the track layout with a thick black outline
         - Speed is visualized using the plasma_r colormap
         - A horizontal colorbar shows the speed scale
-        - The function loads full telemetry data, which may take time
+        - The function loads full telemetry data on the first call, which may
+          take time; the lap's X/Y/Speed arrays are cached on disk afterwards
     
     Example:
         >>> plot_fastest_lap(2024, "Monaco", "Q", "VER")
         >>> plot_fastest_lap(2024, 6, "R", "HAM")  # 6th race of the season
     """
     colormap: mpl.colors.Colormap = mpl.cm.plasma_r
-    session: fastf1.core.Session = fastf1.get_session(year, gp, ses)
-    weekend: fastf1.events.Event = session.event
-    sess: str = session_dict[ses]
-    
-    if type(gp) == str:
-        name: str = gp
-    else:
-        name: str = gp_arr[gp - 1]
+    name: str
+    sess: str
+    name, sess = _resolve_name_and_session_label(gp, ses)
     
-    session.load()
-    lap: fastf1.core.Lap = session.laps.pick_drivers(driver).pick_fastest()
-
-    x: np.ndarray = lap.telemetry['X'].to_numpy()
-    y: np.ndarray = lap.telemetry['Y'].to_numpy()
-    color: np.ndarray = lap.telemetry['Speed'].to_numpy()
+    x: np.ndarray
+    y: np.ndarray
+    color: np.ndarray
+    x, y, color = _load_fastest_lap_xyz(year, gp, ses, driver)
 
-    points: np.ndarray = np.array([x, y]).T.reshape(-1, 1, 2)
-    segments: np.ndarray = np.concatenate([points[:-1], points[1:]], axis=1)
+    segments: np.ndarray = np.empty((len(x) - 1, 2, 2), dtype=np.float32)
+    segments[:, 0, 0] = x[:-1]
+    segments[:, 0, 1] = y[:-1]
+    segments[:, 1, 0] = x[1:]
+    segments[:, 1, 1] = y[1:]
     
     fig: Figure
     ax: Axes
@@ -109,10 +177,10 @@ def plot_fastest_lap(year: int, gp: str | int, ses: str, driver: str) -> None:
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.12)
     ax.axis('off')
 
-    ax.plot(lap.telemetry['X'], lap.telemetry['Y'],
+    ax.plot(x, y,
             color='black', linestyle='-', linewidth=16, zorder=0)
 
-    norm: mpl.colors.Normalize = plt.Normalize(color.min(), color.max())
+    norm: mpl.colors.Normalize = mpl.colors.Normalize(vmin=color.min(), vmax=color.max())
     lc: LineCollection = LineCollection(segments, cmap=colormap, norm=norm,
                                         linestyle='-', linewidth=5)
 
@@ -121,9 +189,8 @@ def plot_fastest_lap(year: int, gp: str | int, ses: str, driver: str) -> None:
     line: LineCollection = ax.add_collection(lc)
 
     cbaxes: Axes = fig.add_axes([0.25, 0.05, 0.5, 0.05])
-    normlegend: mpl.colors.Normalize = mpl.colors.Normalize(vmin=color.min(), vmax=color.max())
     legend: mpl.colorbar.ColorbarBase = mpl.colorbar.ColorbarBase(
-        cbaxes, norm=normlegend, cmap=colormap, orientation="horizontal"
+        cbaxes, norm=norm, cmap=colormap, orientation="horizontal"
     )
 
     plt.show()
@@ -159,30 +226,33 @@ def plot_fastest_lap_plotly(year: int, gp: str | int, ses: str, driver: str) ->
         - Hover over any point to see exact speed
         - Colorscale: Plasma_r (yellow=slow, purple=fast)
         - Maintains aspect ratio for accurate track representation
-        - The function loads full telemetry data, which may take time
+        - Telemetry is subsampled to PLOTLY_MAX_POINTS evenly spaced samples,
+          plus the lap's minimum and maximum speed samples
+        - The function loads full telemetry data on the first call, which may
+          take time; the lap's X/Y/Speed arrays are cached on disk afterwards
     
     Example:
         >>> plot_fastest_lap_plotly(2024, "Monaco", "Q", "VER")
         >>> plot_fastest_lap_plotly(2024, 6, "R", "HAM")  # 6th race
     """
-    session: fastf1.core.Session = fastf1.get_session(year, gp, ses)
-    sess: str = session_dict[ses]
-    
-    if type(gp) == str:
-        name: str = gp
-    else:
-        name: str = gp_arr[gp - 1]
+    name: str
+    sess: str
+    name, sess = _resolve_name_and_session_label(gp, ses)
     
-    session.load()
-    lap: fastf1.core.Lap = session.laps.pick_drivers(driver).pick_fastest()
+    x: np.ndarray
+    y: np.ndarray
+    speed: np.ndarray
+    x, y, speed = _load_fastest_lap_xyz(year, gp, ses, driver)
 
-    x: np.ndarray = lap.telemetry['X'].to_numpy()
-    y: np.ndarray = lap.telemetry['Y'].to_numpy()
-    speed: np.ndarray = lap.telemetry['Speed'].to_numpy()
+    # Keep the slowest and fastest samples so the colorbar spans the real lap
+    idx: np.ndarray = np.union1d(
+        _subsample_by_arclength(x, y, PLOTLY_MAX_POINTS), [speed.argmin(), speed.argmax()]
+    )
+    x, y, speed = x[idx], y[idx], speed[idx]
 
     fig: go.Figure = go.Figure()
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=x,
         y=y,
         mode='markers+lines',